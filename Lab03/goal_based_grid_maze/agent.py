@@ -2,6 +2,7 @@
 # agent_goal_based.py
 # =========================
 from __future__ import annotations
+import copy
 from typing import List, Optional, Tuple
 
 from constants import Action, Percept, LEFT_TURN, RIGHT_TURN, BACK_TURN
@@ -44,6 +45,7 @@ class GoalBasedMazeAgent:
     - Has explicit goal.
     - Computes a shortest path plan using BFS on the known maze.
     - Executes the plan step-by-step (replans if needed).
+    - plan_cells is only ever replaced, never edited, so snapshots and clones share it.
     """
 
     def __init__(self, walls: List[List[int]], start: Tuple[int, int], goal: Tuple[int, int]):
@@ -57,6 +59,15 @@ class GoalBasedMazeAgent:
         self.plan_cells = None
         self.plan_index = 0
 
+    def snapshot(self) -> Tuple[Optional[List[Tuple[int, int]]], int]:
+        return (self.plan_cells, self.plan_index)
+
+    def restore(self, snap: Tuple[Optional[List[Tuple[int, int]]], int]) -> None:
+        self.plan_cells, self.plan_index = snap
+
+    def clone(self) -> GoalBasedMazeAgent:
+        return copy.copy(self)
+
     def _ensure_plan(self, current_pos: Tuple[int, int]) -> None:
         self.plan_cells = bfs_path(self.walls, current_pos, self.goal)
         self.plan_index = 0
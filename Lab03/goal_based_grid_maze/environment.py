@@ -2,6 +2,7 @@
 # environment.py
 # =========================
 from __future__ import annotations
+import copy
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -11,8 +12,7 @@ from constants import (
     Action, Percept
 )
 
-def _wall_bit_for_dir(d: str) -> int:
-    return {"N": WALL_N, "E": WALL_E, "S": WALL_S, "W": WALL_W}[d]
+_WALL_BIT = {"N": WALL_N, "E": WALL_E, "S": WALL_S, "W": WALL_W}
 
 
 @dataclass
@@ -22,6 +22,10 @@ class RobotState:
     heading: str
 
 
+# (r, c, heading, steps): everything that changes while the robot moves
+EnvSnapshot = Tuple[int, int, str, int]
+
+
 class MazeEnv:
     def __init__(
         self,
@@ -43,12 +47,23 @@ class MazeEnv:
         self.robot = RobotState(self.start[0], self.start[1], self.robot.heading)
         self.steps = 0
 
+    def snapshot(self) -> EnvSnapshot:
+        return (self.robot.r, self.robot.c, self.robot.heading, self.steps)
+
+    def restore(self, snap: EnvSnapshot) -> None:
+        self.robot.r, self.robot.c, self.robot.heading, self.steps = snap
+
+    def clone(self) -> MazeEnv:
+        # walls are never modified, so the clone shares them
+        other = copy.copy(self)
+        other.robot = RobotState(self.robot.r, self.robot.c, self.robot.heading)
+        return other
+
     def is_terminal(self) -> bool:
         return (self.robot.r, self.robot.c) == self.goal
 
     def _has_wall(self, r: int, c: int, direction: str) -> bool:
-        bit = _wall_bit_for_dir(direction)
-        return (self.walls[r][c] & bit) != 0
+        return (self.walls[r][c] & _WALL_BIT[direction]) != 0
 
     def _validate_outer_walls(self) -> None:
         for c in range(N):
@@ -0,0 +1,54 @@
+# =========================
+# test_goal_snapshot.py
+# =========================
+
+from __future__ import annotations
+from typing import List, Tuple
+
+from demo import make_sample_maze_8x8
+from environment import MazeEnv
+from agent import GoalBasedMazeAgent
+
+START, GOAL = (0, 0), (7, 7)
+
+
+def _run(env: MazeEnv, agent: GoalBasedMazeAgent, steps: int) -> List[Tuple[int, int, str, int]]:
+    trajectory = []
+    for _ in range(steps):
+        if env.is_terminal():
+            break
+        env.step(agent.act(env.get_percept()))
+        trajectory.append(env.snapshot())
+    return trajectory
+
+
+def test_restored_env_and_agent_replay_the_same_trajectory():
+    walls = make_sample_maze_8x8()
+    env = MazeEnv(walls, start=START, goal=GOAL)
+    agent = GoalBasedMazeAgent(walls, START, GOAL)
+    _run(env, agent, 3)
+
+    env_snap, agent_snap = env.snapshot(), agent.snapshot()
+    first = _run(env, agent, 20)
+    assert env.is_terminal()
+
+    env.restore(env_snap)
+    agent.restore(agent_snap)
+    assert env.snapshot() == env_snap
+    assert _run(env, agent, 20) == first
+
+
+def test_clones_share_walls_but_not_state():
+    walls = make_sample_maze_8x8()
+    env = MazeEnv(walls, start=START, goal=GOAL)
+    agent = GoalBasedMazeAgent(walls, START, GOAL)
+    _run(env, agent, 3)
+    env_before, agent_before = env.snapshot(), agent.snapshot()
+
+    env_clone, agent_clone = env.clone(), agent.clone()
+    assert env_clone.walls is env.walls
+    _run(env_clone, agent_clone, 20)
+
+    assert env_clone.is_terminal()
+    assert env.snapshot() == env_before
+    assert agent.snapshot() == agent_before
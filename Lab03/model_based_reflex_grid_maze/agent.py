@@ -3,10 +3,11 @@
 # =========================
 
 from __future__ import annotations
+import copy
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
-from constants import N, Action, Percept, LEFT_TURN, RIGHT_TURN, BACK_TURN, DIR_TO_VEC
+from constants import N, Action, Percept, LEFT_TURN, RIGHT_TURN, BACK_TURN, DIR_TO_VEC, DIRS, ACTIONS
 
 
 class ModelBasedReflexMazeAgent:
@@ -15,22 +16,45 @@ class ModelBasedReflexMazeAgent:
     - Maintains internal state: visited counts per cell.
     - Uses condition-action rules (no global planning).
     - Action set: TURN_LEFT / TURN_RIGHT / U_TURN / FORWARD.
+    - visit_count is copy-on-write: snapshots and clones share it until the next act().
+    - Optional dead_ends grid (see dead_ends.fill_dead_ends): candidates deeper inside a filled
+      dead end are skipped whenever another candidate exists. The grid is never modified,
+      so agents can share it.
     """
 
-    def __init__(self, goal: Tuple[int, int]):
+    def __init__(self, goal: Tuple[int, int], dead_ends: Optional[List[List[int]]] = None):
         self.goal = goal
+        self.dead_ends = dead_ends
         self.visit_count = [[0 for _ in range(N)] for _ in range(N)]
         self.prev_pos: Optional[Tuple[int, int]] = None  # helps avoid oscillation
+        self._visits_shared = False
 
     def reset(self) -> None:
         self.visit_count = [[0 for _ in range(N)] for _ in range(N)]
         self.prev_pos = None
+        self._visits_shared = False
+
+    def snapshot(self) -> Tuple[List[List[int]], Optional[Tuple[int, int]]]:
+        self._visits_shared = True
+        return (self.visit_count, self.prev_pos)
+
+    def restore(self, snap: Tuple[List[List[int]], Optional[Tuple[int, int]]]) -> None:
+        self.visit_count, self.prev_pos = snap
+        self._visits_shared = True
+
+    def clone(self) -> ModelBasedReflexMazeAgent:
+        other = copy.copy(self)
+        self._visits_shared = other._visits_shared = True
+        return other
 
  
     def act(self, percept: Percept) -> Action:
         (r, c) = percept.position
 
         # Update internal state
+        if self._visits_shared:
+            self.visit_count = [row[:] for row in self.visit_count]
+            self._visits_shared = False
         self.visit_count[r][c] += 1
 
         # If at goal, do nothing meaningful; choose a safe action
@@ -44,6 +68,16 @@ class ModelBasedReflexMazeAgent:
         if not candidates:
             return Action.U_TURN
 
+        # Rule 0: never walk deeper into a filled dead end
+        # (cells filled earlier than the current one lie further from the goal)
+        if self.dead_ends is not None:
+            here = self.dead_ends[r][c] or float("inf")
+            live = [(rel, nxt) for rel, nxt in candidates if not 0 < self.dead_ends[nxt[0]][nxt[1]] < here]
+            if not live:
+                # Every open side leads deeper, so the way out is behind us
+                return Action.U_TURN
+            candidates = live
+
         # Rule 1: reach goal if possible
         for rel_action, (nr, nc) in candidates:
             if (nr, nc) == self.goal:
@@ -109,3 +143,35 @@ class ModelBasedReflexMazeAgent:
             return Action.TURN_LEFT
         if rel == "RIGHT":
             return Action.TURN_RIGHT
+        return Action.FORWARD
+
+
+class PolicyMazeAgent:
+    """
+    Executes a precomputed policy table (see mdp.solve):
+    - table[r, c, d] is an index into ACTIONS for heading DIRS[d].
+    - No internal state; works unchanged under a slipping MazeEnv.
+    """
+
+    def __init__(self, table, goal: Tuple[int, int]):
+        self.table = table
+        self.goal = goal
+
+    def reset(self) -> None:
+        pass
+
+    def snapshot(self) -> None:
+        return None
+
+    def restore(self, snap: None) -> None:
+        pass
+
+    def clone(self) -> PolicyMazeAgent:
+        # The table is read-only, so the clone shares it
+        return PolicyMazeAgent(self.table, self.goal)
+
+    def act(self, percept: Percept) -> Action:
+        r, c = percept.position
+        if (r, c) == self.goal:
+            return Action.U_TURN
+        return ACTIONS[int(self.table[r, c, DIRS.index(percept.heading)])]
@@ -23,6 +23,7 @@ DIR_TO_VEC = {
     "S": (1, 0),
     "W": (0, -1),
 }
+DIR_TO_WALL = {"N": WALL_N, "E": WALL_E, "S": WALL_S, "W": WALL_W}
 
 # Relative directions -> absolute direction index math
 LEFT_TURN = {"N": "W", "W": "S", "S": "E", "E": "N"}
@@ -37,6 +38,28 @@ class Action(Enum):
     U_TURN = auto()  # optional, used for backtracking
 
 
+# Fixed action order used by array-based code (policy tables store indices into this)
+ACTIONS: Tuple[Action, ...] = tuple(Action)
+
+
+@dataclass(frozen=True)
+class SlipModel:
+    """
+    Optional actuator noise for MazeEnv.step:
+    - forward_fail: probability that FORWARD does not move at all.
+    - turn_overshoot: probability that TURN_LEFT/TURN_RIGHT turns one quarter too far
+      (i.e. ends up facing backwards). U_TURN never slips.
+    """
+    forward_fail: float = 0.0
+    turn_overshoot: float = 0.0
+
+    def __post_init__(self) -> None:
+        for name in ("forward_fail", "turn_overshoot"):
+            p = getattr(self, name)
+            if not 0.0 <= p < 1.0:
+                raise ValueError(f"{name} must be in [0, 1), got {p}")
+
+
 @dataclass(frozen=True)
 class Percept:
     front_wall: bool
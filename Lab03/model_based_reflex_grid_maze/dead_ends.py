@@ -0,0 +1,47 @@
+# =========================
+# dead_ends.py
+# =========================
+
+from __future__ import annotations
+from collections import deque
+from typing import List, Tuple
+
+from constants import DIR_TO_VEC, DIR_TO_WALL
+
+
+def _open_neighbors(walls: List[List[int]], r: int, c: int) -> List[Tuple[int, int]]:
+    n = len(walls)
+    result = []
+    for d, (dr, dc) in DIR_TO_VEC.items():
+        nr, nc = r + dr, c + dc
+        if not (walls[r][c] & DIR_TO_WALL[d]) and 0 <= nr < n and 0 <= nc < n:
+            result.append((nr, nc))
+    return result
+
+
+def fill_dead_ends(walls: List[List[int]], goal: Tuple[int, int]) -> List[List[int]]:
+    """
+    Dead-end filling for a known maze, in O(cells):
+    - A cell with at most one open side (three walls) that is not the goal is a dead end.
+    - Filling it closes that side for its neighbour, which may become a dead end in turn.
+    Returns order[r][c]: 0 for cells that are never filled, otherwise the 1-based fill order.
+    A filled cell's way out is always filled later than the cell itself, so a larger number
+    means "closer to the goal". The grid is read-only for agents and can be shared between them.
+    """
+    n = len(walls)
+    order = [[0 for _ in range(n)] for _ in range(n)]
+    degree = [[len(_open_neighbors(walls, r, c)) for c in range(n)] for r in range(n)]
+
+    q = deque((r, c) for r in range(n) for c in range(n) if degree[r][c] <= 1 and (r, c) != goal)
+    filled = 0
+    while q:
+        r, c = q.popleft()
+        filled += 1
+        order[r][c] = filled
+        for nr, nc in _open_neighbors(walls, r, c):
+            if order[nr][nc]:
+                continue
+            degree[nr][nc] -= 1
+            if degree[nr][nc] == 1 and (nr, nc) != goal:
+                q.append((nr, nc))
+    return order
@@ -4,9 +4,13 @@
 
 from __future__ import annotations
 from typing import List
-from constants import N, WALL_N, WALL_E, WALL_S, WALL_W, Action
+from constants import N, WALL_N, WALL_E, WALL_S, WALL_W, Action, SlipModel
 from environment import MazeEnv
-from agent import ModelBasedReflexMazeAgent
+from agent import ModelBasedReflexMazeAgent, PolicyMazeAgent
+from dead_ends import fill_dead_ends
+
+# mdp, localization and planner need numpy/scipy; they are imported inside the
+# demos that use them so that run_episode() works without either installed.
 
 def make_sample_maze_8x8() -> List[List[int]]:
     """
@@ -60,10 +64,11 @@ def make_sample_maze_8x8() -> List[List[int]]:
 
     return walls
 
-def run_episode(max_steps: int = 500) -> None:
+def run_episode(max_steps: int = 500, use_dead_ends: bool = False) -> None:
     walls = make_sample_maze_8x8()
     env = MazeEnv(walls=walls, start=(0, 0), goal=(7, 7), start_heading="E")
-    agent = ModelBasedReflexMazeAgent(goal=(7, 7))
+    dead_ends = fill_dead_ends(walls, goal=(7, 7)) if use_dead_ends else None
+    agent = ModelBasedReflexMazeAgent(goal=(7, 7), dead_ends=dead_ends)
 
     step = 0
     while not env.is_terminal() and step < max_steps:
@@ -74,5 +79,90 @@ def run_episode(max_steps: int = 500) -> None:
 
     print(f"Terminal: {env.is_terminal()} | Steps: {env.steps} | Final: {(env.robot.r, env.robot.c)}")
 
+def run_policy_episode(max_steps: int = 500, seed: int = 0) -> None:
+    from mdp import solve
+
+    walls = make_sample_maze_8x8()
+    slip = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+    env = MazeEnv(walls=walls, start=(0, 0), goal=(7, 7), start_heading="E", slip=slip, seed=seed)
+    agent = PolicyMazeAgent(solve(walls, goal=(7, 7), slip=slip), goal=(7, 7))
+
+    step = 0
+    while not env.is_terminal() and step < max_steps:
+        percept = env.get_percept()
+        action = agent.act(percept)
+        env.step(action)
+        step += 1
+
+    print(f"[policy, slip] Terminal: {env.is_terminal()} | Steps: {env.steps} | Final: {(env.robot.r, env.robot.c)}")
+
+def run_localized_episode(max_steps: int = 500, seed: int = 0) -> None:
+    from mdp import build_transition_model, policy_iteration, policy_table
+    from localization import ParticleFilter
+
+    # The agent never sees the true position: it acts on the particle filter's estimate
+    walls = make_sample_maze_8x8()
+    slip = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+    env = MazeEnv(walls=walls, start=(0, 0), goal=(7, 7), start_heading="E", slip=slip, seed=seed)
+    model = build_transition_model(walls, goal=(7, 7), slip=slip)
+    _, policy = policy_iteration(model)
+    agent = PolicyMazeAgent(policy_table(model, policy), goal=(7, 7))
+    pf = ParticleFilter(model, num_particles=20_000, seed=seed)
+
+    step = 0
+    while not env.is_terminal() and step < max_steps:
+        percept = pf.localize(env.get_percept())
+        action = agent.act(percept)
+        env.step(action)
+        pf.predict(action)
+        step += 1
+
+    print(f"[localized] Terminal: {env.is_terminal()} | Steps: {env.steps} | Final: {(env.robot.r, env.robot.c)}")
+
+def run_planner_episode(max_steps: int = 500, seed: int = 0) -> None:
+    from mdp import solve
+    from planner import RolloutPlanner
+
+    walls = make_sample_maze_8x8()
+    slip = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+    env = MazeEnv(walls=walls, start=(0, 0), goal=(7, 7), start_heading="E", slip=slip, seed=seed)
+    rollout_agent = PolicyMazeAgent(solve(walls, goal=(7, 7), slip=slip), goal=(7, 7))
+    planner = RolloutPlanner(env, rollout_agent, num_rollouts=16, horizon=64, seed=seed)
+
+    step = 0
+    while not env.is_terminal() and step < max_steps:
+        percept = env.get_percept()
+        action = planner.act(percept)
+        env.step(action)
+        step += 1
+
+    print(f"[rollout] Terminal: {env.is_terminal()} | Steps: {env.steps} | Final: {(env.robot.r, env.robot.c)}")
+
+def run_batched_planner_episode(max_steps: int = 500, seed: int = 0) -> None:
+    from mdp import build_transition_model, policy_iteration
+    from planner import PolicyRolloutPlanner
+
+    # Rollouts of the tabular policy run in lockstep as arrays (millions of steps/s)
+    walls = make_sample_maze_8x8()
+    slip = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+    env = MazeEnv(walls=walls, start=(0, 0), goal=(7, 7), start_heading="E", slip=slip, seed=seed)
+    model = build_transition_model(walls, goal=(7, 7), slip=slip)
+    _, policy = policy_iteration(model)
+    planner = PolicyRolloutPlanner(model, policy, num_rollouts=1024, horizon=64, seed=seed)
+
+    step = 0
+    while not env.is_terminal() and step < max_steps:
+        percept = env.get_percept()
+        action = planner.act(percept)
+        env.step(action)
+        step += 1
+
+    print(f"[batched rollout] Terminal: {env.is_terminal()} | Steps: {env.steps} | Final: {(env.robot.r, env.robot.c)}")
+
 if __name__ == "__main__":
     run_episode()
+    run_episode(use_dead_ends=True)
+    run_policy_episode()
+    run_localized_episode()
+    run_planner_episode()
+    run_batched_planner_episode()
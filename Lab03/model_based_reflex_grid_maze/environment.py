@@ -3,22 +3,20 @@
 # =========================
 
 from __future__ import annotations
+import copy
+import random
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
 from constants import (
     N,
-    WALL_N, WALL_E, WALL_S, WALL_W,
-    DIR_TO_VEC, LEFT_TURN, RIGHT_TURN, BACK_TURN,
-    Action, Percept,
+    DIR_TO_VEC, DIR_TO_WALL, LEFT_TURN, RIGHT_TURN, BACK_TURN,
+    Action, Percept, SlipModel,
 )
 
 def _in_bounds(r: int, c: int, n: int) -> bool:
     return 0 <= r < n and 0 <= c < n
 
-def _wall_bit_for_dir(d: str) -> int:
-    return {"N": WALL_N, "E": WALL_E, "S": WALL_S, "W": WALL_W}[d]
-
 def _opposite_dir(d: str) -> str:
     return {"N": "S", "S": "N", "E": "W", "W": "E"}[d]
 
@@ -30,10 +28,16 @@ class RobotState:
     heading: str  # "N","E","S","W"
 
 
+# (r, c, heading, steps): everything that changes while the robot moves
+EnvSnapshot = Tuple[int, int, str, int]
+
+
 class MazeEnv:
     """
     Known-maze environment for an 8x8 grid.
     walls[r][c] is a bitmask with WALL_N/E/S/W.
+    Pass a SlipModel to make FORWARD and turns stochastic (seeded by `seed`).
+    The wall grid is never modified, so clones share it; see snapshot()/restore()/clone().
     """
     def __init__(
         self,
@@ -41,6 +45,8 @@ class MazeEnv:
         start: Tuple[int, int] = (0, 0),
         goal: Tuple[int, int] = (7, 7),
         start_heading: str = "E",
+        slip: Optional[SlipModel] = None,
+        seed: Optional[int] = None,
     ):
         if len(walls) != N or any(len(row) != N for row in walls):
             raise ValueError(f"walls must be {N}x{N}")
@@ -49,6 +55,8 @@ class MazeEnv:
         self.goal = goal
         self.robot = RobotState(start[0], start[1], start_heading)
         self.steps = 0
+        self.slip = slip or SlipModel()
+        self.rng = random.Random(seed)
 
         # Basic validation: ensure outer boundaries have walls
         self._validate_outer_walls()
@@ -57,12 +65,36 @@ class MazeEnv:
         self.robot = RobotState(self.start[0], self.start[1], self.robot.heading)
         self.steps = 0
 
+    def snapshot(self) -> EnvSnapshot:
+        return (self.robot.r, self.robot.c, self.robot.heading, self.steps)
+
+    def restore(self, snap: EnvSnapshot) -> None:
+        """
+        Rewinds the robot and step counter. The RNG is not rewound, so repeated
+        rollouts from one snapshot see fresh slip outcomes.
+        """
+        self.robot.r, self.robot.c, self.robot.heading, self.steps = snap
+
+    def clone(self, seed: Optional[int] = None) -> MazeEnv:
+        """
+        Copy sharing walls/start/goal/slip; only the robot state and RNG are new.
+        Without a seed the clone's RNG continues from a copy of this env's state;
+        either way this env's own slip sequence is left untouched.
+        """
+        other = copy.copy(self)
+        other.robot = RobotState(self.robot.r, self.robot.c, self.robot.heading)
+        other.rng = random.Random()
+        if seed is None:
+            other.rng.setstate(self.rng.getstate())
+        else:
+            other.rng.seed(seed)
+        return other
+
     def is_terminal(self) -> bool:
         return (self.robot.r, self.robot.c) == self.goal
 
     def _has_wall(self, r: int, c: int, direction: str) -> bool:
-        bit = _wall_bit_for_dir(direction)
-        return (self.walls[r][c] & bit) != 0
+        return (self.walls[r][c] & DIR_TO_WALL[direction]) != 0
 
     def _validate_outer_walls(self) -> None:
         # Top row must have N walls; bottom row must have S walls; etc.
@@ -77,6 +109,10 @@ class MazeEnv:
             if not self._has_wall(r, N - 1, "E"):
                 raise ValueError("Right boundary missing an EAST wall")
 
+    def _slips(self, p: float) -> bool:
+        # Only draw from the RNG when slip is enabled, so the deterministic mode is unchanged
+        return p > 0.0 and self.rng.random() < p
+
     def get_percept(self) -> Percept:
         r, c, h = self.robot.r, self.robot.c, self.robot.heading
         front = self._has_wall(r, c, h)
@@ -103,9 +139,13 @@ class MazeEnv:
 
         if action == Action.TURN_LEFT:
             self.robot.heading = LEFT_TURN[h]
+            if self._slips(self.slip.turn_overshoot):
+                self.robot.heading = BACK_TURN[h]
             return
         if action == Action.TURN_RIGHT:
             self.robot.heading = RIGHT_TURN[h]
+            if self._slips(self.slip.turn_overshoot):
+                self.robot.heading = BACK_TURN[h]
             return
         if action == Action.U_TURN:
             self.robot.heading = BACK_TURN[h]
@@ -115,6 +155,9 @@ class MazeEnv:
             if self._has_wall(r, c, h):
                 # blocked: stay in place
                 return
+            if self._slips(self.slip.forward_fail):
+                # wheels slipped: stay in place
+                return
             dr, dc = DIR_TO_VEC[h]
             nr, nc = r + dr, c + dc
             # in a well-formed maze, bounds should be protected by walls;
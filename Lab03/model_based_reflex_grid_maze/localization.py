@@ -0,0 +1,126 @@
+# =========================
+# localization.py
+# =========================
+
+from __future__ import annotations
+from typing import Optional, Tuple
+
+import numpy as np
+
+from constants import DIRS, ACTIONS, Action, Percept
+from mdp import TransitionModel
+
+# Number of set bits in a 3-bit wall code (front, left, right)
+_POPCOUNT3 = np.array([0, 1, 1, 2, 1, 2, 2, 3], dtype=np.int64)
+
+
+def _wall_code(front: bool, left: bool, right: bool) -> int:
+    return (int(front) << 2) | (int(left) << 1) | int(right)
+
+
+class ParticleFilter:
+    """
+    Particle-filter localization over (cell, heading) for a known maze.
+    - Particles are state indices of a TransitionModel (see mdp.py), one int64 each.
+    - update() weights particles by the front/left/right wall bits only.
+    - predict() samples the MazeEnv.step motion model (including slip) from the model's tensor.
+    Position and heading in the incoming Percept are never read. An episode only runs
+    while the robot is off the goal, so goal states are given zero weight.
+    """
+
+    def __init__(
+        self,
+        model: TransitionModel,
+        num_particles: int = 100_000,
+        sensor_error: float = 0.01,
+        seed: Optional[int] = None,
+    ):
+        if not 0.0 <= sensor_error < 0.5:
+            raise ValueError("sensor_error must be in [0, 0.5)")
+        self.model = model
+        self.num_particles = num_particles
+        self.rng = np.random.default_rng(seed)
+
+        # Expected wall code for every state, derived from where FORWARD is blocked
+        S = model.num_states
+        s = np.arange(S, dtype=np.int64)
+        blocked = model.next_state[ACTIONS.index(Action.FORWARD), :, 0] == s
+        base = s & ~3
+        d = s & 3
+        front = blocked
+        left = blocked[base | ((d + 3) & 3)]
+        right = blocked[base | ((d + 1) & 3)]
+        self.obs_code = (front.astype(np.int64) << 2) | (left.astype(np.int64) << 1) | right
+
+        # Likelihood by number of mismatching bits (0..3)
+        m = np.arange(4)
+        self.likelihood = (1.0 - sensor_error) ** (3 - m) * sensor_error ** m
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.particles = self.rng.integers(0, self.model.num_states, self.num_particles)
+        self.weights = np.full(self.num_particles, 1.0 / self.num_particles)
+
+    def update(self, percept: Percept) -> None:
+        z = _wall_code(percept.front_wall, percept.left_wall, percept.right_wall)
+        mismatches = _POPCOUNT3[self.obs_code[self.particles] ^ z]
+        w = self.weights * self.likelihood[mismatches]
+        w[self.model.goal_mask[self.particles]] = 0.0
+        total = w.sum()
+
+        if total <= 0.0:
+            # Every particle contradicts the reading (only possible with sensor_error=0):
+            # restart from the states that agree with it
+            consistent = np.flatnonzero((self.obs_code == z) & ~self.model.goal_mask)
+            if consistent.size == 0:
+                consistent = np.arange(self.model.num_states)
+            self.particles = consistent[self.rng.integers(0, consistent.size, self.num_particles)]
+            self.weights = np.full(self.num_particles, 1.0 / self.num_particles)
+            return
+
+        self.weights = w / total
+        if 1.0 / np.dot(self.weights, self.weights) < 0.5 * self.num_particles:
+            self._resample()
+
+    def _resample(self) -> None:
+        # Systematic resampling: one random offset, evenly spaced pointers
+        positions = (self.rng.random() + np.arange(self.num_particles)) / self.num_particles
+        cdf = np.cumsum(self.weights)
+        cdf[-1] = 1.0
+        self.particles = self.particles[np.searchsorted(cdf, positions)]
+        self.weights = np.full(self.num_particles, 1.0 / self.num_particles)
+
+    def predict(self, action: Optional[Action]) -> None:
+        if action is None:
+            # MazeEnv.step treats None as a NO-OP
+            return
+        a = ACTIONS.index(action)
+        slipped = (self.rng.random(self.num_particles) < self.model.prob[a, self.particles, 1]).astype(np.int64)
+        self.particles = self.model.next_state[a, self.particles, slipped]
+
+    def belief(self) -> np.ndarray:
+        """Posterior probability of each state, shape (S,)."""
+        return np.bincount(self.particles, weights=self.weights, minlength=self.model.num_states)
+
+    def estimate(self) -> Tuple[Tuple[int, int], str, float]:
+        """Most likely (position, heading) and its posterior probability."""
+        b = self.belief()
+        s = int(np.argmax(b))
+        cell, d = s >> 2, s & 3
+        return (cell // self.model.n, cell % self.model.n), DIRS[d], float(b[s])
+
+    def localize(self, percept: Percept) -> Percept:
+        """
+        Updates with a percept's wall bits and returns the same percept with
+        position/heading replaced by the estimate, ready to pass to any agent's act().
+        """
+        self.update(percept)
+        position, heading, _ = self.estimate()
+        return Percept(
+            front_wall=percept.front_wall,
+            left_wall=percept.left_wall,
+            right_wall=percept.right_wall,
+            position=position,
+            heading=heading,
+        )
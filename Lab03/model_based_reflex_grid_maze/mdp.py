@@ -0,0 +1,251 @@
+# =========================
+# mdp.py
+# =========================
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.sparse.linalg import spsolve
+
+from constants import DIRS, DIR_TO_WALL, ACTIONS, Action, SlipModel
+
+# Heading index d follows DIRS ("N","E","S","W"); a state is s = (r * n + c) * 4 + d.
+_WALL_BITS = np.array([DIR_TO_WALL[d] for d in DIRS], dtype=np.int64)
+_DR = np.array([-1, 0, 1, 0], dtype=np.int64)
+_DC = np.array([0, 1, 0, -1], dtype=np.int64)
+
+
+def state_index(r: int, c: int, heading: str, n: int) -> int:
+    return (r * n + c) * 4 + DIRS.index(heading)
+
+
+@dataclass(frozen=True)
+class TransitionModel:
+    """
+    Sparse transition tensor of the (cell, heading) MDP, built once per maze.
+    Every (action, state) pair has at most two outcomes (nominal move, slip):
+    next_state[a, s, k] with probability prob[a, s, k], k in {0, 1}.
+    Each step costs 1; the goal cell is absorbing with value 0.
+    """
+    n: int
+    goal: Tuple[int, int]
+    next_state: np.ndarray  # (len(ACTIONS), S, 2) int64
+    prob: np.ndarray        # (len(ACTIONS), S, 2) float64
+    goal_mask: np.ndarray   # (S,) bool
+
+    @property
+    def num_states(self) -> int:
+        return self.goal_mask.shape[0]
+
+    def matrix(self, a: int) -> sparse.csr_matrix:
+        """P[a] as an S x S CSR matrix."""
+        return _ell_to_csr(self.next_state[a], self.prob[a])
+
+
+def _ell_to_csr(next_state: np.ndarray, prob: np.ndarray) -> sparse.csr_matrix:
+    S = next_state.shape[0]
+    indptr = np.arange(0, 2 * S + 1, 2, dtype=np.int64)
+    return sparse.csr_matrix((prob.ravel(), next_state.ravel(), indptr), shape=(S, S))
+
+
+def build_transition_model(
+    walls: Sequence[Sequence[int]],
+    goal: Tuple[int, int],
+    slip: Optional[SlipModel] = None,
+) -> TransitionModel:
+    """
+    Builds the transition tensor for MazeEnv.step (with optional slip) using array operations.
+    Works for any square wall grid, not only N x N.
+    """
+    slip = slip or SlipModel()
+    w = np.asarray(walls, dtype=np.int64)
+    if w.ndim != 2 or w.shape[0] != w.shape[1]:
+        raise ValueError("walls must be a square grid")
+    n = w.shape[0]
+    S = n * n * 4
+
+    s = np.arange(S, dtype=np.int64)
+    d = s & 3
+    cell = s >> 2
+    r, c = cell // n, cell % n
+
+    # FORWARD: blocked by a wall (or the grid edge) means staying in place
+    nr, nc = r + _DR[d], c + _DC[d]
+    open_ = ((w.ravel()[cell] & _WALL_BITS[d]) == 0) & (nr >= 0) & (nr < n) & (nc >= 0) & (nc < n)
+    fwd = np.where(open_, ((nr * n + nc) << 2) | d, s)
+
+    def turned(k: int) -> np.ndarray:
+        return (cell << 2) | ((d + k) & 3)
+
+    left, right, back = turned(3), turned(1), turned(2)
+    pf, pt = slip.forward_fail, slip.turn_overshoot
+
+    next_state = np.empty((len(ACTIONS), S, 2), dtype=np.int64)
+    prob = np.empty((len(ACTIONS), S, 2), dtype=np.float64)
+    outcomes = {
+        Action.FORWARD: (fwd, s, pf),
+        Action.TURN_LEFT: (left, back, pt),
+        Action.TURN_RIGHT: (right, back, pt),
+        Action.U_TURN: (back, back, 0.0),
+    }
+    for a, action in enumerate(ACTIONS):
+        nominal, slipped, p = outcomes[action]
+        next_state[a, :, 0] = nominal
+        next_state[a, :, 1] = slipped
+        prob[a, :, 0] = 1.0 - p
+        prob[a, :, 1] = p
+
+    gr, gc = goal
+    goal_mask = cell == gr * n + gc
+    return TransitionModel(n, goal, next_state, prob, goal_mask)
+
+
+def _q_values(model: TransitionModel, V: np.ndarray, gamma: float) -> np.ndarray:
+    # (A, S): 1 + gamma * sum_k prob * V[next]. V is inf where the goal is unreachable;
+    # outcomes with probability 0 are dropped first so that 0 * inf cannot produce nan.
+    Vn = np.where(model.prob > 0.0, V[model.next_state], 0.0)
+    return 1.0 + gamma * np.einsum("ask,ask->as", model.prob, Vn)
+
+
+def nominal_cost_to_go(model: TransitionModel) -> np.ndarray:
+    """
+    Cost-to-go when every action takes its nominal outcome, paying the expected number of
+    attempts (1 / (1 - p)) per action. Exact for FORWARD slips, a close estimate for turns.
+    One multi-source Dijkstra from the goal states; inf where the goal is unreachable.
+    """
+    A, S = model.next_state.shape[:2]
+    src = np.tile(np.arange(S, dtype=np.int64), A)
+    dst = model.next_state[:, :, 0].ravel()
+    cost = (1.0 / model.prob[:, :, 0]).ravel()
+    keep = (src != dst) & ~model.goal_mask[src]
+    # Edges reversed so that distances are measured towards the goal
+    graph = sparse.csr_matrix((cost[keep], (dst[keep], src[keep])), shape=(S, S))
+    goals = np.flatnonzero(model.goal_mask)
+    return csgraph.dijkstra(graph, indices=goals, min_only=True)
+
+
+def _nominal_policy(model: TransitionModel, D: np.ndarray) -> np.ndarray:
+    # Greedy on D through nominal outcomes: a proper policy, and usually close to optimal
+    Dn = D[model.next_state[:, :, 0]] + 1.0 / model.prob[:, :, 0]
+    Dn[model.next_state[:, :, 0] == np.arange(model.num_states)] = np.inf
+    return np.argmin(Dn, axis=0).astype(np.int8)
+
+
+def _fixed_states(D: np.ndarray) -> np.ndarray:
+    # States whose value is not solved for: the goal, and states that cannot reach it
+    return (D == 0.0) | ~np.isfinite(D)
+
+
+def _finish(V: np.ndarray, D: np.ndarray) -> np.ndarray:
+    # Goal states are worth 0 and states that cannot reach it inf; D already holds exactly that
+    return np.where(_fixed_states(D), D, V)
+
+
+def greedy_policy(model: TransitionModel, V: np.ndarray, gamma: float = 1.0) -> np.ndarray:
+    """Returns the greedy action index (into ACTIONS) for every state; V must be inf where the goal is unreachable."""
+    return np.argmin(_q_values(model, V, gamma), axis=0).astype(np.int8)
+
+
+def value_iteration(
+    model: TransitionModel,
+    gamma: float = 1.0,
+    tol: float = 1e-6,
+    max_iter: int = 100_000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Synchronous Bellman sweeps over all states at once, warm-started from nominal_cost_to_go.
+    Returns (V, policy), both of shape (S,); policy holds indices into ACTIONS.
+    """
+    D = nominal_cost_to_go(model)
+    fixed = _fixed_states(D)
+    free = ~fixed
+    V = D.copy()
+    for _ in range(max_iter):
+        V_new = _q_values(model, V, gamma).min(axis=0)
+        V_new[fixed] = D[fixed]
+        delta = np.max(np.abs(V_new[free] - V[free]), initial=0.0)
+        V = V_new
+        if delta < tol:
+            break
+    return V, greedy_policy(model, V, gamma)
+
+
+def evaluate_policy(
+    model: TransitionModel,
+    policy: np.ndarray,
+    gamma: float = 1.0,
+    D: Optional[np.ndarray] = None,
+    order_key: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Exact policy evaluation: one sparse linear solve of (I - gamma * P_pi) V = 1.
+    Unknowns are ordered by `order_key` (an estimate of V) so that the system is
+    nearly triangular and the factorization has little fill-in.
+    """
+    if D is None:
+        D = nominal_cost_to_go(model)
+    if order_key is None:
+        order_key = D
+    S = model.num_states
+    s = np.arange(S)
+    fixed = _fixed_states(D)
+    nxt = model.next_state[policy, s]
+    p = model.prob[policy, s] * gamma
+    p[fixed] = 0.0
+    A = sparse.identity(S, format="csr") - _ell_to_csr(nxt, p)
+    b = np.where(fixed, 0.0, 1.0)
+
+    order = np.argsort(np.where(np.isfinite(order_key), order_key, -1.0), kind="stable")
+    x = spsolve(A[order][:, order].tocsc(), b[order], permc_spec="NATURAL")
+    V = np.empty(S)
+    V[order] = x
+    return _finish(V, D)
+
+
+def policy_iteration(
+    model: TransitionModel,
+    gamma: float = 1.0,
+    max_iter: int = 100,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Policy iteration seeded with the greedy policy on nominal_cost_to_go.
+    Each round is one sparse solve plus one vectorized improvement step;
+    the seed is near-optimal, so only a few rounds are needed.
+    Returns (V, policy), both of shape (S,).
+    """
+    D = nominal_cost_to_go(model)
+    fixed = _fixed_states(D)
+    policy = _nominal_policy(model, D)
+    V = evaluate_policy(model, policy, gamma, D)
+    s = np.arange(model.num_states)
+    for _ in range(max_iter):
+        Q = _q_values(model, V, gamma)
+        best = np.argmin(Q, axis=0).astype(np.int8)
+        # Only switch when strictly better, so ties cannot make the loop cycle
+        improve = (Q[best, s] < Q[policy, s] - 1e-9) & ~fixed
+        if not improve.any():
+            break
+        policy = np.where(improve, best, policy).astype(np.int8)
+        V = evaluate_policy(model, policy, gamma, D, order_key=V)
+    return V, policy
+
+
+def policy_table(model: TransitionModel, policy: np.ndarray) -> np.ndarray:
+    """Reshapes a flat policy into an (n, n, 4) table indexed by [r, c, DIRS.index(heading)]."""
+    return policy.reshape(model.n, model.n, 4)
+
+
+def solve(
+    walls: List[List[int]],
+    goal: Tuple[int, int],
+    slip: Optional[SlipModel] = None,
+    gamma: float = 1.0,
+) -> np.ndarray:
+    """Convenience wrapper: build the model once and return the optimal (n, n, 4) policy table."""
+    model = build_transition_model(walls, goal, slip)
+    _, policy = policy_iteration(model, gamma)
+    return policy_table(model, policy)
@@ -0,0 +1,137 @@
+# =========================
+# planner.py
+# =========================
+
+from __future__ import annotations
+from typing import Optional, Sequence
+
+import numpy as np
+
+from constants import ACTIONS, Action, Percept
+from environment import MazeEnv
+from mdp import TransitionModel, state_index
+
+
+class RolloutPlanner:
+    """
+    Monte-Carlo rollout planner on top of snapshot()/restore()/clone():
+    - Keeps a private clone of the environment (sharing its walls) as a simulator,
+      with its own RNG seeded by `seed` so the real env's slip sequence is not disturbed.
+    - For every first action, runs `num_rollouts` rollouts of `rollout_agent` for up to `horizon` steps.
+    - Picks the action with the lowest mean step count. Truncated rollouts are charged
+      the Manhattan distance still left to the goal.
+    Works with any agent that has act()/snapshot()/restore()/clone(). For a stateful agent
+    (e.g. ModelBasedReflexMazeAgent) pass the live agent's snapshot() to act(), so that
+    rollouts start from its real history rather than the state it had at construction.
+    """
+
+    def __init__(
+        self,
+        env: MazeEnv,
+        rollout_agent,
+        num_rollouts: int = 16,
+        horizon: int = 64,
+        actions: Sequence[Action] = ACTIONS,
+        seed: Optional[int] = None,
+    ):
+        # A fresh seed (not the env's copied state), so rollouts don't replay the real future
+        self.sim = env.clone()
+        self.sim.rng.seed(seed)
+        self.rollout_agent = rollout_agent.clone()
+        self.num_rollouts = num_rollouts
+        self.horizon = horizon
+        self.actions = tuple(actions)
+
+    def reset(self) -> None:
+        self.rollout_agent.reset()
+
+    def act(self, percept: Percept, agent_snapshot=None) -> Action:
+        r, c = percept.position
+        if (r, c) == self.sim.goal:
+            return Action.U_TURN
+
+        if agent_snapshot is not None:
+            self.rollout_agent.restore(agent_snapshot)
+        root = (r, c, percept.heading, 0)
+        agent_root = self.rollout_agent.snapshot()
+
+        best_action, best_cost = self.actions[0], float("inf")
+        for action in self.actions:
+            total = 0.0
+            for _ in range(self.num_rollouts):
+                self.sim.restore(root)
+                self.rollout_agent.restore(agent_root)
+                total += self._rollout(action)
+            if total < best_cost:
+                best_action, best_cost = action, total
+
+        self.rollout_agent.restore(agent_root)
+        return best_action
+
+    def _rollout(self, first: Action) -> float:
+        sim, agent = self.sim, self.rollout_agent
+        sim.step(first)
+        # Bounded by iterations, not sim.steps: a None action does not count as a step
+        for _ in range(self.horizon - 1):
+            if sim.is_terminal():
+                return sim.steps
+            sim.step(agent.act(sim.get_percept()))
+        gr, gc = sim.goal
+        return sim.steps + abs(sim.robot.r - gr) + abs(sim.robot.c - gc)
+
+
+class PolicyRolloutPlanner:
+    """
+    Batched variant of RolloutPlanner for a tabular rollout policy (e.g. from mdp.solve):
+    all rollouts advance in lockstep as arrays over the TransitionModel, which keeps
+    lookahead in the tens of millions of simulated steps per second.
+    """
+
+    def __init__(
+        self,
+        model: TransitionModel,
+        policy: np.ndarray,
+        num_rollouts: int = 1024,
+        horizon: int = 64,
+        seed: Optional[int] = None,
+    ):
+        self.model = model
+        self.policy = np.asarray(policy).ravel()
+        self.num_rollouts = num_rollouts
+        self.horizon = horizon
+        self.rng = np.random.default_rng(seed)
+
+        # Manhattan distance to the goal per state, charged to truncated rollouts
+        cell = np.arange(model.num_states) >> 2
+        gr, gc = model.goal
+        self.remaining = (np.abs(cell // model.n - gr) + np.abs(cell % model.n - gc)).astype(np.float64)
+
+    def reset(self) -> None:
+        pass
+
+    def _sample(self, states: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        slipped = (self.rng.random(states.shape[0]) < self.model.prob[actions, states, 1]).astype(np.int64)
+        return self.model.next_state[actions, states, slipped]
+
+    def rollout_costs(self, state: int) -> np.ndarray:
+        """Mean cost of each first action (indexed like ACTIONS) followed by the policy."""
+        A, K = len(ACTIONS), self.num_rollouts
+        first = np.repeat(np.arange(A), K)
+        states = self._sample(np.full(A * K, state, dtype=np.int64), first)
+        cost = np.ones(A * K)
+        done = self.model.goal_mask[states]
+        for _ in range(self.horizon - 1):
+            if done.all():
+                break
+            states = np.where(done, states, self._sample(states, self.policy[states]))
+            cost += ~done
+            done = self.model.goal_mask[states]
+        cost += np.where(done, 0.0, self.remaining[states])
+        return cost.reshape(A, K).mean(axis=1)
+
+    def act(self, percept: Percept) -> Action:
+        r, c = percept.position
+        if (r, c) == self.model.goal:
+            return Action.U_TURN
+        costs = self.rollout_costs(state_index(r, c, percept.heading, self.model.n))
+        return ACTIONS[int(np.argmin(costs))]
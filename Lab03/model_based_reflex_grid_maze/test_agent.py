@@ -0,0 +1,30 @@
+# =========================
+# test_agent.py
+# =========================
+
+from __future__ import annotations
+
+from constants import Action, Percept
+from agent import ModelBasedReflexMazeAgent
+from demo import make_sample_maze_8x8
+from environment import MazeEnv
+
+GOAL = (7, 7)
+
+
+def test_moves_forward_when_only_front_is_open():
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    percept = Percept(front_wall=False, left_wall=True, right_wall=True, position=(3, 3), heading="E")
+    assert agent.act(percept) == Action.FORWARD
+
+
+def test_demo_episode_reaches_goal():
+    # Used to end with Steps: 0 when FORWARD was never returned
+    env = MazeEnv(make_sample_maze_8x8(), start=(0, 0), goal=GOAL, start_heading="E")
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    for _ in range(500):
+        if env.is_terminal():
+            break
+        env.step(agent.act(env.get_percept()))
+    assert env.is_terminal()
+    assert env.steps > 0
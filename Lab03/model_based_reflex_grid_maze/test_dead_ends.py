@@ -0,0 +1,50 @@
+# =========================
+# test_dead_ends.py
+# =========================
+
+from __future__ import annotations
+
+from constants import Action, Percept
+from agent import ModelBasedReflexMazeAgent
+from dead_ends import fill_dead_ends
+from environment import MazeEnv
+from mdp import build_transition_model, state_index, value_iteration
+
+# Perfect 8x8 maze: the whole top row is a dead-end corridor whose way out is to the west
+PERFECT_MAZE = [
+    [13, 1, 5, 5, 5, 5, 5, 7],
+    [11, 8, 3, 9, 1, 7, 13, 3],
+    [10, 14, 12, 2, 12, 5, 5, 6],
+    [10, 9, 1, 4, 1, 7, 13, 3],
+    [10, 14, 8, 7, 10, 11, 9, 6],
+    [10, 9, 4, 7, 12, 2, 10, 11],
+    [12, 2, 9, 5, 7, 8, 0, 6],
+    [13, 4, 6, 13, 5, 6, 12, 7],
+]
+GOAL = (7, 7)
+
+
+def test_fill_order_points_towards_goal():
+    order = fill_dead_ends(PERFECT_MAZE, GOAL)
+    assert order[7][7] == 0
+    assert 0 < order[0][5] < order[0][4] < order[0][3]
+
+
+def test_turns_back_when_every_side_leads_deeper():
+    agent = ModelBasedReflexMazeAgent(GOAL, fill_dead_ends(PERFECT_MAZE, GOAL))
+    # At (0,4) facing east only the front is open, and it leads further into the dead end
+    percept = Percept(front_wall=False, left_wall=True, right_wall=True, position=(0, 4), heading="E")
+    assert agent.act(percept) == Action.U_TURN
+
+
+def test_facing_backwards_start_takes_the_shortest_route():
+    env = MazeEnv(PERFECT_MAZE, start=(0, 4), goal=GOAL, start_heading="E")
+    agent = ModelBasedReflexMazeAgent(GOAL, fill_dead_ends(PERFECT_MAZE, GOAL))
+    for _ in range(500):
+        if env.is_terminal():
+            break
+        env.step(agent.act(env.get_percept()))
+
+    V, _ = value_iteration(build_transition_model(PERFECT_MAZE, GOAL))
+    assert env.is_terminal()
+    assert env.steps == V[state_index(0, 4, "E", len(PERFECT_MAZE))]
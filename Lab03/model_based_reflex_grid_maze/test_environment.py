@@ -0,0 +1,40 @@
+# =========================
+# test_environment.py
+# =========================
+
+from __future__ import annotations
+from typing import List, Tuple
+
+from constants import Action, SlipModel
+from demo import make_sample_maze_8x8
+from environment import MazeEnv
+from agent import PolicyMazeAgent
+from mdp import solve
+from planner import RolloutPlanner
+
+SLIP = SlipModel(forward_fail=0.3, turn_overshoot=0.2)
+
+
+def _trajectory(env: MazeEnv, steps: int = 20) -> List[Tuple[int, int, str, int]]:
+    result = []
+    for _ in range(steps):
+        env.step(Action.FORWARD)
+        result.append(env.snapshot())
+    return result
+
+
+def test_clone_does_not_change_seeded_slip_sequence():
+    walls = make_sample_maze_8x8()
+    expected = _trajectory(MazeEnv(walls, slip=SLIP, seed=3))
+
+    env = MazeEnv(walls, slip=SLIP, seed=3)
+    env.clone()
+    env.clone(seed=7)
+    RolloutPlanner(env, PolicyMazeAgent(solve(walls, (7, 7), SLIP), (7, 7)), seed=0)
+    assert _trajectory(env) == expected
+
+
+def test_clone_without_seed_continues_the_same_stream():
+    walls = make_sample_maze_8x8()
+    env = MazeEnv(walls, slip=SLIP, seed=3)
+    assert _trajectory(env.clone()) == _trajectory(env)
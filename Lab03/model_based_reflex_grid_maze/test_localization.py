@@ -0,0 +1,63 @@
+# =========================
+# test_localization.py
+# =========================
+
+from __future__ import annotations
+import random
+
+import numpy as np
+
+from constants import N, DIRS, ACTIONS, SlipModel, Percept
+from demo import make_sample_maze_8x8
+from environment import MazeEnv
+from localization import ParticleFilter, _wall_code
+from mdp import build_transition_model, state_index
+from test_dead_ends import PERFECT_MAZE
+
+GOAL = (7, 7)
+SLIP = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+
+
+def test_obs_code_matches_env_percepts():
+    for walls in (make_sample_maze_8x8(), PERFECT_MAZE):
+        pf = ParticleFilter(build_transition_model(walls, GOAL), num_particles=10, seed=0)
+        for r in range(N):
+            for c in range(N):
+                for h in DIRS:
+                    p = MazeEnv(walls, start=(r, c), goal=GOAL, start_heading=h).get_percept()
+                    expected = _wall_code(p.front_wall, p.left_wall, p.right_wall)
+                    assert pf.obs_code[state_index(r, c, h, N)] == expected
+
+
+def test_seeded_episode_converges_to_true_state():
+    model = build_transition_model(PERFECT_MAZE, GOAL, SLIP)
+    for seed in (1, 2, 3):
+        env = MazeEnv(PERFECT_MAZE, start=(3, 3), goal=GOAL, start_heading="N", slip=SLIP, seed=seed)
+        pf = ParticleFilter(model, num_particles=20_000, seed=seed)
+        rng = random.Random(seed)
+        tracked = []
+        for _ in range(100):
+            percept = env.get_percept()
+            estimate = pf.localize(percept)
+            tracked.append((estimate.position, estimate.heading) == (percept.position, percept.heading))
+            action = rng.choice(ACTIONS)
+            env.step(action)
+            pf.predict(action)
+        assert all(tracked[-20:])
+
+
+def test_zero_sensor_error_reseeds_from_consistent_non_goal_states():
+    model = build_transition_model(PERFECT_MAZE, GOAL)
+    pf = ParticleFilter(model, num_particles=5_000, sensor_error=0.0, seed=0)
+
+    # Choose a reading that a goal state also produces, so the goal exclusion is exercised
+    goal_state = state_index(GOAL[0], GOAL[1], "N", N)
+    z = int(pf.obs_code[goal_state])
+    pf.particles[:] = int(np.flatnonzero(pf.obs_code != z)[0])
+
+    front, left, right = bool(z & 4), bool(z & 2), bool(z & 1)
+    pf.update(Percept(front, left, right, position=(0, 0), heading="N"))
+
+    assert np.all(pf.obs_code[pf.particles] == z)
+    assert not np.any(model.goal_mask[pf.particles])
+    assert np.allclose(pf.weights, 1.0 / pf.num_particles)
@@ -0,0 +1,60 @@
+# =========================
+# test_mdp.py
+# =========================
+
+from __future__ import annotations
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from constants import N, DIRS, DIR_TO_VEC, DIR_TO_WALL, LEFT_TURN, RIGHT_TURN, BACK_TURN, ACTIONS, Action, SlipModel
+from demo import make_sample_maze_8x8
+from mdp import build_transition_model, policy_iteration, state_index, value_iteration
+
+GOAL = (7, 7)
+SLIP = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+
+
+def _outcomes(walls: List[List[int]], r: int, c: int, h: str, action: Action) -> List[Tuple[float, Tuple[int, int, str]]]:
+    # MazeEnv.step, written out state by state
+    pf, pt = SLIP.forward_fail, SLIP.turn_overshoot
+    if action == Action.FORWARD:
+        dr, dc = DIR_TO_VEC[h]
+        if walls[r][c] & DIR_TO_WALL[h] or not (0 <= r + dr < N and 0 <= c + dc < N):
+            return [(1.0, (r, c, h))]
+        return [(1.0 - pf, (r + dr, c + dc, h)), (pf, (r, c, h))]
+    if action == Action.TURN_LEFT:
+        return [(1.0 - pt, (r, c, LEFT_TURN[h])), (pt, (r, c, BACK_TURN[h]))]
+    if action == Action.TURN_RIGHT:
+        return [(1.0 - pt, (r, c, RIGHT_TURN[h])), (pt, (r, c, BACK_TURN[h]))]
+    return [(1.0, (r, c, BACK_TURN[h]))]
+
+
+def _brute_force_values(walls: List[List[int]], sweeps: int = 2000) -> Dict[Tuple[int, int, str], float]:
+    # Gauss-Seidel sweeps from V = 0; states that cannot reach the goal grow by one per sweep
+    states = [(r, c, h) for r in range(N) for c in range(N) for h in DIRS]
+    V = {s: 0.0 for s in states}
+    for _ in range(sweeps):
+        for s in states:
+            if s[:2] == GOAL:
+                continue
+            V[s] = min(1.0 + sum(p * V[t] for p, t in _outcomes(walls, *s, a)) for a in ACTIONS)
+    return {s: (math.inf if v > sweeps / 2 else v) for s, v in V.items()}
+
+
+def test_unreachable_trap_is_not_treated_as_goal():
+    walls = make_sample_maze_8x8()
+    walls[3][7] = 15  # one-way wall: (3,6) still sees an open east side, (3,7) can never be left
+    model = build_transition_model(walls, GOAL, SLIP)
+    expected = _brute_force_values(walls)
+
+    for solver in (policy_iteration, value_iteration):
+        V, policy = solver(model)
+        for (r, c, h), v in expected.items():
+            s = state_index(r, c, h, N)
+            if math.isinf(v):
+                assert np.isinf(V[s])
+            else:
+                assert abs(V[s] - v) < 1e-6
+        assert ACTIONS[policy[state_index(3, 6, "E", N)]] != Action.FORWARD
@@ -0,0 +1,25 @@
+# =========================
+# test_planner.py
+# =========================
+
+from __future__ import annotations
+
+from constants import SlipModel
+from demo import make_sample_maze_8x8
+from mdp import build_transition_model, policy_iteration, state_index
+from planner import PolicyRolloutPlanner
+
+GOAL = (7, 7)
+SLIP = SlipModel(forward_fail=0.1, turn_overshoot=0.05)
+
+
+def test_batched_rollouts_match_policy_value():
+    model = build_transition_model(make_sample_maze_8x8(), GOAL, SLIP)
+    V, policy = policy_iteration(model)
+    planner = PolicyRolloutPlanner(model, policy, num_rollouts=20_000, horizon=128, seed=0)
+
+    for r, c, h in [(0, 0, "E"), (3, 4, "N"), (6, 1, "W")]:
+        s = state_index(r, c, h, model.n)
+        costs = planner.rollout_costs(s)
+        # standard error of the mean is ~0.03 steps with this many rollouts
+        assert abs(costs[policy[s]] - V[s]) < 0.2
@@ -0,0 +1,85 @@
+# =========================
+# test_snapshot.py
+# =========================
+
+from __future__ import annotations
+from typing import List, Tuple
+
+from constants import Action
+from demo import make_sample_maze_8x8
+from environment import MazeEnv
+from agent import ModelBasedReflexMazeAgent
+
+GOAL = (7, 7)
+
+
+def _run(env: MazeEnv, agent: ModelBasedReflexMazeAgent, steps: int) -> List[Tuple[int, int, str, int]]:
+    trajectory = []
+    for _ in range(steps):
+        env.step(agent.act(env.get_percept()))
+        trajectory.append(env.snapshot())
+    return trajectory
+
+
+def _grid(agent: ModelBasedReflexMazeAgent) -> List[List[int]]:
+    return [row[:] for row in agent.visit_count]
+
+
+def test_acting_after_restore_leaves_snapshot_unchanged():
+    env = MazeEnv(make_sample_maze_8x8())
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    _run(env, agent, 5)
+
+    snap = agent.snapshot()
+    saved = [row[:] for row in snap[0]]
+    _run(env, agent, 5)
+    agent.restore(snap)
+    _run(env, agent, 5)
+
+    assert snap[0] == saved
+    agent.restore(snap)
+    assert _grid(agent) == saved
+
+
+def test_acting_on_clone_leaves_source_unchanged():
+    env = MazeEnv(make_sample_maze_8x8())
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    _run(env, agent, 5)
+    before, prev = _grid(agent), agent.prev_pos
+
+    clone = agent.clone()
+    _run(env.clone(), clone, 10)
+
+    assert _grid(agent) == before
+    assert agent.prev_pos == prev
+    assert _grid(clone) != before
+
+    # and the other way round: the source acting does not leak into the clone
+    clone_before = _grid(clone)
+    _run(env, agent, 3)
+    assert _grid(clone) == clone_before
+
+
+def test_restored_env_replays_the_same_trajectory():
+    env = MazeEnv(make_sample_maze_8x8())
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    _run(env, agent, 3)
+
+    env_snap, agent_snap = env.snapshot(), agent.snapshot()
+    first = _run(env, agent, 10)
+    env.restore(env_snap)
+    agent.restore(agent_snap)
+    assert _run(env, agent, 10) == first
+
+
+def test_rollout_planner_starts_from_live_agent_history():
+    from planner import RolloutPlanner
+
+    env = MazeEnv(make_sample_maze_8x8())
+    agent = ModelBasedReflexMazeAgent(GOAL)
+    planner = RolloutPlanner(env, agent, num_rollouts=2, horizon=8, seed=0)
+    _run(env, agent, 6)
+
+    planner.act(env.get_percept(), agent.snapshot())
+    assert _grid(planner.rollout_agent) == _grid(agent)
+    assert planner.rollout_agent.prev_pos == agent.prev_pos